@@ -1,24 +1,41 @@
 import logging
 
+import orjson
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from src.core.exceptions import NotFoundError, ValidationError
 
 logger = logging.getLogger(__name__)
 
+_INTERNAL_ERROR_BODY = orjson.dumps({"detail": "Internal server error"})
 
-async def _not_found_handler(request: Request, exc: NotFoundError) -> JSONResponse:
-    return JSONResponse(status_code=404, content={"detail": exc.message})
 
+def _json_response(status_code: int, body: bytes) -> Response:
+    return Response(content=body, status_code=status_code, media_type="application/json")
 
-async def _validation_handler(request: Request, exc: ValidationError) -> JSONResponse:
-    return JSONResponse(status_code=400, content={"detail": exc.message})
 
+def _detail_body(detail: str) -> bytes:
+    return orjson.dumps({"detail": detail})
 
-async def _generic_handler(request: Request, exc: Exception) -> JSONResponse:
-    logger.error("Unhandled exception: %s", exc, exc_info=True)
-    return JSONResponse(status_code=500, content={"detail": "Internal server error"})
+
+async def _not_found_handler(request: Request, exc: NotFoundError) -> Response:
+    return _json_response(404, _detail_body(exc.message))
+
+
+async def _validation_handler(request: Request, exc: ValidationError) -> Response:
+    return _json_response(400, _detail_body(exc.message))
+
+
+async def _generic_handler(request: Request, exc: Exception) -> Response:
+    logger.error(
+        "Unhandled exception on %s %s: %s",
+        request.method,
+        request.url.path,
+        exc,
+        exc_info=True,
+    )
+    return _json_response(500, _INTERNAL_ERROR_BODY)
 
 
 def register_exception_handlers(app: FastAPI) -> None:
@@ -1,18 +1,22 @@
+import logging
+
 from fastapi import FastAPI
 
+logger = logging.getLogger(__name__)
+
 
 def generate_openapi_file(app: FastAPI) -> None:
-    import json
+    import orjson
 
-    from src.core.config import BASE_DIR
+    from src.core.config import BASE_DIR, settings
 
     try:
-        output_path = BASE_DIR / "var" / "app" / "openapi.json"
+        output_path = BASE_DIR / settings.app.openapi_file_path
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w") as f:
-            json.dump(app.openapi(), f, indent=2)
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(app.openapi(), option=orjson.OPT_INDENT_2))
 
-        print(f"OpenAPI JSON generated at {output_path}")
+        logger.info("OpenAPI JSON generated at %s", output_path)
     except Exception as e:
-        print(f"Failed to generate OpenAPI file: {e}")
+        logger.error("Failed to generate OpenAPI file: %s", e)
@@ -30,10 +30,14 @@ class PostgresConfig(BaseModel):
     url: PostgresDsn = Field(...)
     echo: bool = Field(default=False)
     echo_pool: bool = Field(default=False)
-    pool_size: int = Field(default=10)
-    max_overflow: int = Field(default=5)
+    pool_size: int = Field(default=25)
+    max_overflow: int = Field(default=25)
     pool_pre_ping: bool = Field(default=True)
     pool_timeout: int = Field(default=30)
+    pool_recycle: int = Field(default=1800)
+    pool_use_lifo: bool = Field(default=True)
+    prepared_statement_cache_size: int = Field(default=1024)
+    jit: bool = Field(default=False)
 
 
 class AppConfig(BaseModel):
@@ -1,3 +1,7 @@
+import logging
+from typing import Any
+
+import orjson
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -6,6 +10,12 @@ from sqlalchemy.ext.asyncio import (
 
 from src.core.config import PostgresConfig
 
+logger = logging.getLogger(__name__)
+
+
+def _json_serializer(obj: Any) -> str:
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 class DatabaseHelper:
     def __init__(self, config: PostgresConfig) -> None:
@@ -17,6 +27,21 @@ class DatabaseHelper:
             max_overflow=config.max_overflow,
             pool_pre_ping=config.pool_pre_ping,
             pool_timeout=config.pool_timeout,
+            pool_recycle=config.pool_recycle,
+            pool_use_lifo=config.pool_use_lifo,
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads,
+            connect_args={
+                "prepared_statement_cache_size": config.prepared_statement_cache_size,
+                "server_settings": {"jit": "on" if config.jit else "off"},
+            },
+        )
+        logger.info(
+            "Database pool: size=%s, max_overflow=%s, recycle=%ss, lifo=%s",
+            config.pool_size,
+            config.max_overflow,
+            config.pool_recycle,
+            config.pool_use_lifo,
         )
         self.async_session_factory = async_sessionmaker[AsyncSession](
             bind=self.engine,
@@ -1,4 +1,5 @@
 import uuid
+from typing import ClassVar
 
 from sqlalchemy import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
@@ -7,4 +8,6 @@ from src.core.types import IDType
 
 
 class Base(DeclarativeBase):
+    __eager__: ClassVar[tuple[str, ...]] = ()
+
     id: Mapped[IDType] = mapped_column(UUID, default=uuid.uuid7, primary_key=True)
@@ -1,10 +1,22 @@
 import logging
-from collections.abc import Sequence
+from collections.abc import AsyncGenerator, Collection, Sequence
 from typing import Any
 
-from sqlalchemy import Result, func, select, update
+from sqlalchemy import (
+    Result,
+    Row,
+    Select,
+    delete,
+    func,
+    inspect,
+    lambda_stmt,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
+from src.core.exceptions import NotFoundError, ValidationError
 from src.core.types import UNSET, IDType
 from src.infra.db.models import Base
 
@@ -15,45 +27,155 @@ class BaseRepository[T: Base]:
     def __init__(self, model: type[T], session: AsyncSession):
         self.model = model
         self.session = session
+        self.default_load_options: list[Any] = [
+            selectinload(getattr(model, name)) for name in model.__eager__
+        ]
+
+    async def _load_eager(self, entity: T) -> None:
+        # Loader options only apply when a row is actually loaded; entities
+        # already in the identity map (e.g. just created) need a refresh.
+        unloaded = inspect(entity).unloaded
+        names = [name for name in self.model.__eager__ if name in unloaded]
+        if names:
+            await self.session.refresh(entity, attribute_names=names)
 
     async def get_by_id(self, id: IDType) -> T | None:
-        return await self.session.get(self.model, id)
+        entity = await self.session.get(self.model, id, options=self.default_load_options)
+        if entity is not None:
+            await self._load_eager(entity)
+        return entity
 
-    async def find(
+    async def get_many_by_ids(self, ids: Collection[IDType]) -> dict[IDType, T]:
+        if not ids:
+            return {}
+        model, load_options = self.model, self.default_load_options
+        query = lambda_stmt(lambda: select(model).where(model.id.in_(ids)))
+        if load_options:
+            query += lambda s: s.options(*load_options)
+        result = await self.session.scalars(query)
+        return {entity.id: entity for entity in result}
+
+    def _apply_find_clauses[Q: Select[Any]](
         self,
+        query: Q,
         filters: list[Any] | None = None,
         order_by: Any | None = None,
         limit: int | None = None,
         offset: int | None = None,
-        load_options: list[Any] | None = None,
-    ) -> Sequence[T]:
-        query = select(self.model)
-
+    ) -> Q:
         if filters:
             query = query.where(*filters)
 
         if order_by is not None:
             query = query.order_by(order_by)
 
-        if load_options:
-            query = query.options(*load_options)
-
         if offset:
             query = query.offset(offset)
 
         if limit:
             query = query.limit(limit)
 
+        return query
+
+    def _apply_load_options[Q: Select[Any]](self, query: Q, load_options: list[Any] | None) -> Q:
+        if load_options is None:
+            load_options = self.default_load_options
+
+        if load_options:
+            query = query.options(*load_options)
+
+        return query
+
+    def _build_find_query(
+        self,
+        filters: list[Any] | None = None,
+        order_by: Any | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        load_options: list[Any] | None = None,
+    ) -> Select[tuple[T]]:
+        query = self._apply_load_options(select(self.model), load_options)
+        return self._apply_find_clauses(query, filters, order_by, limit, offset)
+
+    async def find(
+        self,
+        filters: list[Any] | None = None,
+        order_by: Any | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        load_options: list[Any] | None = None,
+    ) -> Sequence[T]:
+        query = self._build_find_query(filters, order_by, limit, offset, load_options)
         result = await self.session.scalars(query)
         return result.all()
 
+    async def iter_find(
+        self,
+        filters: list[Any] | None = None,
+        order_by: Any | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        load_options: list[Any] | None = None,
+        yield_per: int = 1000,
+    ) -> AsyncGenerator[T]:
+        query = self._build_find_query(filters, order_by, limit, offset, load_options)
+        result = await self.session.stream_scalars(query.execution_options(yield_per=yield_per))
+        try:
+            async for entity in result:
+                yield entity
+        finally:
+            await result.close()
+
+    async def find_columns(
+        self,
+        columns: Sequence[Any],
+        filters: list[Any] | None = None,
+        order_by: Any | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> Sequence[Row[Any]]:
+        query = select(*columns).select_from(self.model)
+        query = self._apply_find_clauses(query, filters, order_by, limit, offset)
+        result = await self.session.execute(query)
+        return result.all()
+
+    async def get_paginated(
+        self,
+        page: int,
+        per_page: int,
+        filters: list[Any] | None = None,
+        order_by: Any | None = None,
+        load_options: list[Any] | None = None,
+    ) -> tuple[Sequence[T], int]:
+        if page < 1:
+            raise ValidationError("page must be greater than or equal to 1")
+        if per_page < 1:
+            raise ValidationError("per_page must be greater than or equal to 1")
+
+        query = self._apply_load_options(select(self.model, func.count().over()), load_options)
+        offset = (page - 1) * per_page
+        query = self._apply_find_clauses(query, filters, order_by, per_page, offset)
+
+        result = await self.session.execute(query)
+        rows = result.all()
+        if not rows:
+            # The window total is only available alongside rows, so fall back
+            # to a plain count when the page lies past the end of the result set.
+            total = await self.count(filters) if page > 1 else 0
+            return [], total
+        return [row[0] for row in rows], rows[0][1]
+
     async def get_all(self, **filter_by: Any) -> Sequence[T]:
         query = select(self.model).filter_by(**filter_by)
+        if self.default_load_options:
+            query = query.options(*self.default_load_options)
         result = await self.session.execute(query)
         return result.scalars().all()
 
     async def get_one_or_none(self, **filter_by: Any) -> T | None:
         query = select(self.model).filter_by(**filter_by)
+        if self.default_load_options:
+            query = query.options(*self.default_load_options)
         result: Result[tuple[T]] = await self.session.execute(query)
         return result.scalar_one_or_none()
 
@@ -61,26 +183,38 @@ class BaseRepository[T: Base]:
         entity = self.model(**data)
         self.session.add(entity)
         await self.session.flush()
-        await self.session.refresh(entity)
+        await self._load_eager(entity)
         return entity
 
     async def update(self, id: IDType, **data: Any) -> T:
         result = await self.session.execute(
-            update(self.model).where(self.model.id == id).values(**data).returning(self.model)
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**data)
+            .returning(self.model)
+            .options(*self.default_load_options)
         )
         updated_entity = result.scalar_one_or_none()
         if not updated_entity:
-            raise ValueError(f"Entity with id {id} not found")
+            raise NotFoundError(f"{self.model.__name__} with id {id} not found")
         await self.session.flush()
         return updated_entity
 
     async def patch(self, id: IDType, **data: Any) -> T:
         filtered_data = {k: v for k, v in data.items() if v is not UNSET}
+        if not filtered_data:
+            entity = await self.get_by_id(id)
+            if not entity:
+                raise NotFoundError(f"{self.model.__name__} with id {id} not found")
+            return entity
         return await self.update(id, **filtered_data)
 
-    async def delete(self, entity: T) -> None:
-        await self.session.delete(entity)
-        await self.session.flush()
+    async def delete(self, id: IDType) -> None:
+        deleted_id = await self.session.scalar(
+            delete(self.model).where(self.model.id == id).returning(self.model.id)
+        )
+        if deleted_id is None:
+            raise NotFoundError(f"{self.model.__name__} with id {id} not found")
 
     async def count(self, filters: list[Any] | None = None) -> int:
         query = select(func.count()).select_from(self.model)
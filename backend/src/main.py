@@ -26,7 +26,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
         format=settings.logging.format,
         datefmt=settings.logging.date_format,
     )
-    generate_openapi_file(app)
+    if settings.app.generate_openapi_file:
+        generate_openapi_file(app)
 
     try:
         yield
@@ -41,13 +42,14 @@ app = FastAPI(
     redoc_url=None,
     openapi_url="/openapi.json" if settings.app.debug else None,
 )
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.app.allowed_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+if settings.app.allowed_origins:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.app.allowed_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 register_exception_handlers(app)
 app.include_router(router)
 setup_dishka(container=container, app=app)
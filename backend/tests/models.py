@@ -0,0 +1,27 @@
+import uuid
+
+from sqlalchemy import UUID, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from src.infra.db.models import Base
+
+
+class Child(Base):
+    __tablename__ = "test_child"
+
+    name: Mapped[str] = mapped_column(String)
+    parent_id: Mapped[uuid.UUID] = mapped_column(UUID, ForeignKey("test_parent.id"))
+
+
+class Parent(Base):
+    __tablename__ = "test_parent"
+    __eager__ = ("children",)
+
+    name: Mapped[str] = mapped_column(String)
+    children: Mapped[list[Child]] = relationship()
+
+
+class Other(Base):
+    __tablename__ = "test_other"
+
+    name: Mapped[str] = mapped_column(String)
@@ -0,0 +1,319 @@
+import uuid
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import instance_state
+
+from src.core.exceptions import NotFoundError, ValidationError
+from src.core.types import UNSET
+from src.infra.db.repositories import BaseRepository
+
+from .models import Child, Other, Parent
+
+
+def _is_loaded(entity: object, attr: str) -> bool:
+    return attr not in instance_state(entity).unloaded
+
+
+async def _seed_others(session: AsyncSession, count: int) -> BaseRepository[Other]:
+    repo = BaseRepository(Other, session)
+    for i in range(count):
+        await repo.create(name=f"other-{i}")
+    session.expunge_all()
+    return repo
+
+
+def _record_statements(session: AsyncSession) -> list[str]:
+    statements: list[str] = []
+
+    def _before_cursor_execute(*args: Any) -> None:
+        statements.append(args[2])
+
+    event.listen(session.bind.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    return statements
+
+
+async def test_create_issues_no_select(session: AsyncSession) -> None:
+    repo = BaseRepository(Other, session)
+    statements = _record_statements(session)
+
+    entity = await repo.create(name="o")
+
+    assert entity.id is not None
+    assert statements
+    assert not any(statement.lstrip().upper().startswith("SELECT") for statement in statements)
+
+
+async def test_create_accepts_relationship_kwargs(session: AsyncSession) -> None:
+    repo = BaseRepository(Parent, session)
+
+    parent = await repo.create(name="p", children=[Child(name="c1"), Child(name="c2")])
+
+    assert sorted(child.name for child in parent.children) == ["c1", "c2"]
+    assert all(child.parent_id == parent.id for child in parent.children)
+
+
+async def test_get_many_by_ids_returns_entities_keyed_by_id(session: AsyncSession) -> None:
+    repo = await _seed_others(session, 3)
+    ids = [entity.id for entity in await repo.find()]
+
+    result = await repo.get_many_by_ids([ids[0], ids[2], uuid.uuid7()])
+
+    assert set(result) == {ids[0], ids[2]}
+    assert all(result[id].id == id for id in result)
+    assert await repo.get_many_by_ids([]) == {}
+
+
+async def test_get_many_by_ids_keeps_models_apart(session: AsyncSession) -> None:
+    parents = BaseRepository(Parent, session)
+    children = BaseRepository(Child, session)
+    others = BaseRepository(Other, session)
+    parent = await parents.create(name="p", children=[Child(name="c")])
+    child_id = parent.children[0].id
+    other = await others.create(name="o")
+    session.expunge_all()
+
+    # The statement is cached per call site, so interleave models with and
+    # without __eager__ to make sure cached statements are not shared.
+    for _ in range(2):
+        found_other = await others.get_many_by_ids([other.id])
+        found_child = await children.get_many_by_ids([child_id])
+        found_parent = await parents.get_many_by_ids([parent.id])
+
+        assert isinstance(found_other[other.id], Other)
+        assert isinstance(found_child[child_id], Child)
+        assert isinstance(found_parent[parent.id], Parent)
+        assert _is_loaded(found_parent[parent.id], "children")
+        session.expunge_all()
+
+
+async def test_get_paginated_returns_page_and_total(session: AsyncSession) -> None:
+    repo = await _seed_others(session, 5)
+
+    first, total = await repo.get_paginated(1, 2, order_by=Other.name)
+    last, last_total = await repo.get_paginated(3, 2, order_by=Other.name)
+
+    assert [entity.name for entity in first] == ["other-0", "other-1"]
+    assert [entity.name for entity in last] == ["other-4"]
+    assert total == last_total == 5
+
+
+async def test_get_paginated_counts_when_page_is_past_the_end(session: AsyncSession) -> None:
+    repo = await _seed_others(session, 3)
+
+    items, total = await repo.get_paginated(5, 2)
+
+    assert items == []
+    assert total == 3
+
+
+async def test_get_paginated_empty_first_page(session: AsyncSession) -> None:
+    repo = BaseRepository(Other, session)
+
+    assert await repo.get_paginated(1, 10) == ([], 0)
+
+
+async def test_get_paginated_applies_load_options(session: AsyncSession) -> None:
+    repo = BaseRepository(Parent, session)
+    await repo.create(name="p", children=[Child(name="c")])
+    session.expunge_all()
+
+    (eager,), _ = await repo.get_paginated(1, 10)
+    assert _is_loaded(eager, "children")
+    session.expunge_all()
+
+    (lazy,), _ = await repo.get_paginated(1, 10, load_options=[])
+    assert not _is_loaded(lazy, "children")
+
+
+@pytest.mark.parametrize(("page", "per_page"), [(0, 10), (1, 0)])
+async def test_get_paginated_rejects_invalid_arguments(
+    session: AsyncSession, page: int, per_page: int
+) -> None:
+    repo = BaseRepository(Other, session)
+
+    with pytest.raises(ValidationError):
+        await repo.get_paginated(page, per_page)
+
+
+async def test_create_loads_eager_relationships(session: AsyncSession) -> None:
+    repo = BaseRepository(Parent, session)
+
+    parent = await repo.create(name="p")
+
+    assert _is_loaded(parent, "children")
+    assert parent.children == []
+
+
+async def test_get_by_id_eager_loads_declared_relationships(session: AsyncSession) -> None:
+    repo = BaseRepository(Parent, session)
+    parent = await repo.create(name="p", children=[Child(name="c")])
+    session.expunge_all()
+
+    loaded = await repo.get_by_id(parent.id)
+
+    assert loaded is not None
+    assert _is_loaded(loaded, "children")
+    assert [child.name for child in loaded.children] == ["c"]
+
+
+async def test_get_by_id_after_create_has_eager_relationships(session: AsyncSession) -> None:
+    repo = BaseRepository(Parent, session)
+    created = await repo.create(name="p")
+
+    loaded = await repo.get_by_id(created.id)
+
+    assert loaded is created
+    assert _is_loaded(loaded, "children")
+    assert loaded.children == []
+
+
+async def test_get_by_id_loads_eager_relationships_from_identity_map(
+    session: AsyncSession,
+) -> None:
+    repo = BaseRepository(Parent, session)
+    parent = await repo.create(name="p", children=[Child(name="c")])
+    session.expunge_all()
+    (lazy,) = await repo.find(load_options=[])
+
+    loaded = await repo.get_by_id(parent.id)
+
+    assert loaded is lazy
+    assert _is_loaded(loaded, "children")
+    assert [child.name for child in loaded.children] == ["c"]
+
+
+async def test_find_uses_eager_defaults_unless_overridden(session: AsyncSession) -> None:
+    repo = BaseRepository(Parent, session)
+    await repo.create(name="p", children=[Child(name="c")])
+    session.expunge_all()
+
+    (eager,) = await repo.find()
+    assert _is_loaded(eager, "children")
+    session.expunge_all()
+
+    (lazy,) = await repo.find(load_options=[])
+    assert not _is_loaded(lazy, "children")
+
+
+async def test_update_returns_entity_with_eager_relationships(session: AsyncSession) -> None:
+    repo = BaseRepository(Parent, session)
+    parent = await repo.create(name="p", children=[Child(name="c")])
+    session.expunge_all()
+
+    updated = await repo.update(parent.id, name="renamed")
+
+    assert updated.name == "renamed"
+    assert _is_loaded(updated, "children")
+    assert len(updated.children) == 1
+
+
+async def test_iter_find_streams_in_order(session: AsyncSession) -> None:
+    repo = await _seed_others(session, 4)
+
+    names = [entity.name async for entity in repo.iter_find(order_by=Other.name, limit=3)]
+
+    assert names == ["other-0", "other-1", "other-2"]
+
+
+async def test_iter_find_loads_rows_in_batches(session: AsyncSession) -> None:
+    repo = await _seed_others(session, 50)
+    loaded: list[Other] = []
+
+    def _on_load(target: Other, context: Any) -> None:
+        loaded.append(target)
+
+    event.listen(Other, "load", _on_load)
+    try:
+        stream = repo.iter_find(order_by=Other.name, yield_per=10)
+        first = await anext(stream)
+        loaded_before_first = len(loaded)
+        rest = [entity async for entity in stream]
+    finally:
+        event.remove(Other, "load", _on_load)
+
+    assert first.name == "other-0"
+    assert loaded_before_first == 10
+    assert len(rest) == 49
+
+
+async def test_iter_find_can_be_closed_early(session: AsyncSession) -> None:
+    repo = await _seed_others(session, 3)
+
+    stream = repo.iter_find(order_by=Other.name)
+    first = await anext(stream)
+    await stream.aclose()
+
+    assert first.name == "other-0"
+    assert await repo.count() == 3
+
+
+async def test_patch_without_values_returns_entity_with_eager_relationships(
+    session: AsyncSession,
+) -> None:
+    repo = BaseRepository(Parent, session)
+    parent = await repo.create(name="p", children=[Child(name="c")])
+    session.expunge_all()
+    (lazy,) = await repo.find(load_options=[])
+
+    patched = await repo.patch(parent.id, name=UNSET)
+
+    assert patched is lazy
+    assert _is_loaded(patched, "children")
+    assert [child.name for child in patched.children] == ["c"]
+
+
+async def test_patch_updates_only_set_values(session: AsyncSession) -> None:
+    repo = BaseRepository(Parent, session)
+    parent = await repo.create(name="p", children=[Child(name="c")])
+    session.expunge_all()
+
+    patched = await repo.patch(parent.id, name="renamed", children=UNSET)
+
+    assert patched.name == "renamed"
+    assert [child.name for child in patched.children] == ["c"]
+
+
+@pytest.mark.parametrize("data", [{}, {"name": "renamed"}])
+async def test_patch_missing_id_raises_not_found(
+    session: AsyncSession, data: dict[str, Any]
+) -> None:
+    repo = BaseRepository(Other, session)
+
+    with pytest.raises(NotFoundError):
+        await repo.patch(uuid.uuid7(), **data)
+
+
+async def test_update_missing_id_raises_not_found(session: AsyncSession) -> None:
+    repo = BaseRepository(Other, session)
+
+    with pytest.raises(NotFoundError):
+        await repo.update(uuid.uuid7(), name="renamed")
+
+
+async def test_delete_removes_entity(session: AsyncSession) -> None:
+    repo = await _seed_others(session, 2)
+    (first, second) = await repo.find(order_by=Other.name)
+
+    await repo.delete(first.id)
+
+    assert [entity.id for entity in await repo.find()] == [second.id]
+
+
+async def test_delete_missing_id_raises_not_found(session: AsyncSession) -> None:
+    repo = BaseRepository(Other, session)
+
+    with pytest.raises(NotFoundError):
+        await repo.delete(uuid.uuid7())
+
+
+async def test_find_columns_returns_rows(session: AsyncSession) -> None:
+    repo = await _seed_others(session, 3)
+
+    rows = await repo.find_columns(
+        [Other.name], filters=[Other.name != "other-0"], order_by=Other.name.desc()
+    )
+
+    assert [tuple(row) for row in rows] == [("other-2",), ("other-1",)]